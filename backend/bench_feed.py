@@ -0,0 +1,33 @@
+import random, time, uuid
+from feed import TradeFeed
+
+# Feed latency with tens of thousands of stored trades.
+# Run with `python bench_feed.py`.
+
+def make_trade(i):
+    return {
+        'trade_id': str(uuid.uuid4()), 'underlying': 'NIFTY', 'day': 25, 'month': 'SEP',
+        'year': 2026, 'strike': 24500.0 + 50 * (i % 40), 'opt': 'CE' if i % 2 else 'PE',
+        'entry_low': 120.0, 'entry_high': 125.0, 'stoploss': 100.0, 'targets': [140.0, 160.0],
+        'instrument_token': 10000 + i, 'tradingsymbol': f'NIFTY25SEP{24500 + 50 * (i % 40)}CE',
+        'exchange': 'NFO', 'lot_size': 75, 'title': 'NIFTY 25 SEP 24500 CE', 'entry': '120.0-125.0',
+    }
+
+def timeit(fn, n=2000):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+if __name__ == '__main__':
+    rnd = random.Random(1)
+    for size in (10_000, 50_000):
+        feed = TradeFeed()
+        for i in range(size):
+            feed.append(make_trade(i))
+        recent = feed.cursor(feed.head - 5)
+        etag = feed.etag(recent, 100)
+        print(f"trades={size}")
+        print(f"  delta (last 5)      {timeit(lambda: feed.page(recent, 100)):8.2f} us")
+        print(f"  full page (100)     {timeit(lambda: feed.page(feed.cursor(rnd.randrange(feed.head)), 100)):8.2f} us")
+        print(f"  etag check (304)    {timeit(lambda: feed.etag(recent, 100) == etag):8.2f} us")
@@ -0,0 +1,82 @@
+import random, re, time
+import parser
+from parser import parse_trade, register_format, unregister_format
+
+# Corpus benchmark: per-message parse cost as more provider formats are
+# registered. Run with `python bench_parser.py`.
+
+SAMPLE = """Enter: NIFTY 25 SEP 24500 CALL
+Entry Price Range: 120-125
+Stop Loss: 100
+Target 1: 140
+Target 2: 160"""
+
+NOISE = [
+    "Good morning traders, market opens flat today.",
+    "Booked profits in BANKNIFTY, trail your stop loss.",
+    "Webinar tonight at 8 PM, link in bio.",
+]
+
+def keyword(i):
+    # prova, provb, ..., provba, ...
+    letters = ''
+    while True:
+        letters = chr(ord('a') + i % 26) + letters
+        i //= 26
+        if not i:
+            return 'prov' + letters
+
+def add_synthetic(i):
+    kw = keyword(i)
+    rx = re.compile(rf'{kw}:\s+([A-Z]+)\s+(\d+)\s+(CE|PE)\s+@\s*([0-9.]+)', re.I)
+
+    def extract(text):
+        m = rx.search(text)
+        if not m:
+            return None
+        return {'underlying': m.group(1).upper(), 'strike': float(m.group(2)),
+                'opt': m.group(3).upper(), 'entry_high': float(m.group(4))}
+
+    register_format(kw)(extract)
+    return kw
+
+def make_corpus(keywords, n=5000, seed=1):
+    """
+    Mix of messages for the built-in grammar, for the synthetic grammars, messages
+    naming several keywords where only a later one parses, and plain noise.
+    """
+    rnd = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        r = rnd.random()
+        kw = rnd.choice(keywords)
+        if r < 0.35:
+            corpus.append(SAMPLE)
+        elif r < 0.65:
+            corpus.append(f"{kw.upper()}: NIFTY 24500 CE @ 125")
+        elif r < 0.85:
+            other = rnd.choice(keywords)
+            corpus.append(f"Enter slowly, {other} desk says wait. {kw}: BANKNIFTY 51000 PE @ 310")
+        else:
+            corpus.append(rnd.choice(NOISE))
+    return corpus
+
+def run(corpus, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for msg in corpus:
+            parse_trade(msg)
+        dt = (time.perf_counter() - t0) / len(corpus)
+        best = dt if best is None else min(best, dt)
+    return best
+
+if __name__ == '__main__':
+    added = []
+    for target in (1, 5, 20, 100):
+        while len(added) < target:
+            added.append(add_synthetic(len(added)))
+        corpus = make_corpus(added)
+        print(f"grammars={len(set(parser.FORMATS.values())):4d}  {run(corpus) * 1e6:7.2f} us/msg")
+    for kw in added:
+        unregister_format(kw)
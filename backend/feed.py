@@ -0,0 +1,74 @@
+import json
+import threading
+import uuid
+
+class TradeFeed:
+    """
+    Append-only, sequenced index over stored trades.
+
+    Every trade gets a monotonically increasing `seq` when appended and is
+    serialized once, so serving a page is a slice plus a byte join.
+
+    The store is in memory, so seqs restart at 1 with the process. Cursors and
+    ETags are therefore "<epoch>.<seq>", where epoch is random per TradeFeed.
+    Each trade carries its own `cursor`, and pages carry `next`; clients pass
+    either back as `since` to fetch only newer trades. A cursor from another
+    epoch, or a bare seq, replays from the start.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blobs = []
+        self.epoch = uuid.uuid4().hex[:12]
+        self.head = 0
+
+    def append(self, trade):
+        """Assigns the next seq to `trade` (in place) and indexes it."""
+        with self._lock:
+            seq = self.head + 1
+            trade['seq'] = seq
+            trade['cursor'] = self.cursor(seq)
+            self._blobs.append(json.dumps(trade, separators=(',', ':'), default=str).encode())
+            self.head = seq
+        return seq
+
+    def cursor(self, seq):
+        return f'{self.epoch}.{seq}'
+
+    def _since(self, since):
+        epoch, _, seq = (since or '').partition('.')
+        # isdecimal() alone admits non-ASCII digits like '٣'
+        if epoch != self.epoch or not (seq.isascii() and seq.isdecimal()):
+            return 0
+        return min(int(seq), self.head)
+
+    def etag(self, since='', limit=100):
+        # trades are immutable once appended, so a page only changes with head
+        return f'"{self.cursor(self.head)}-{self._since(since)}-{limit}"'
+
+    def page(self, since='', limit=100):
+        """Returns (etag, body) for up to `limit` trades after cursor `since`."""
+        with self._lock:
+            head = self.head
+            seq = self._since(since)
+            # seqs are 1..head, so the trade after `seq` sits at index `seq`
+            blobs = self._blobs[seq:seq + limit]
+            last = seq + len(blobs)
+        more = 'true' if last < head else 'false'
+        body = (b'{"trades":[' + b','.join(blobs) +
+                f'],"next":"{self.cursor(last)}","head":"{self.cursor(head)}","more":{more}}}'.encode())
+        return f'"{self.cursor(head)}-{seq}-{limit}"', body
+
+def etag_matches(if_none_match, etag):
+    """True if an If-None-Match header value covers `etag` (weak compare, lists, `*`)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return True
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
@@ -1,4 +1,7 @@
+import os
+import sys
 import pandas as pd
+from pandas.api.types import is_integer_dtype
 from datetime import datetime
 
 MONTHS = {
@@ -6,50 +9,135 @@ MONTHS = {
     'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
 }
 
-def load_instruments(path='instruments.csv'):
-    df = pd.read_csv(path)
-    df['expiry'] = pd.to_datetime(df['expiry'], errors='coerce')
+# Only these columns and segments are used by resolve()
+COMPACT_COLUMNS = ['instrument_token', 'tradingsymbol', 'name', 'expiry',
+                   'strike', 'lot_size', 'instrument_type', 'exchange']
+COMPACT_EXCHANGES = ('NFO',)
+COMPACT_TYPES = ('CE', 'PE')
+CHUNK_ROWS = 50_000
+
+def load_instruments(path='instruments.csv', full=False):
+    """
+    Loads the instruments dump.
+
+    By default only NFO option rows and the columns resolve() needs are kept:
+    name/instrument_type/exchange become categoricals, tradingsymbol (unique
+    per row) stays a plain string column, and expiry is stored as an int32
+    YYYYMMDD.
+    The dump is read in chunks of CHUNK_ROWS and each chunk is filtered before
+    the next is parsed, so other exchanges never sit in memory all at once.
+    Pass full=True to keep the whole table (all exchanges and columns) for
+    debugging.
+    """
+    if full:
+        df = pd.read_csv(path)
+        df['expiry'] = pd.to_datetime(df['expiry'], errors='coerce')
+        return df
+
+    reader = pd.read_csv(
+        path,
+        usecols=COMPACT_COLUMNS,
+        dtype={'tradingsymbol': 'string', 'name': 'string',
+               'instrument_type': 'string', 'exchange': 'string'},
+        chunksize=CHUNK_ROWS,
+    )
+    df = pd.concat([
+        chunk[
+            chunk['exchange'].isin(COMPACT_EXCHANGES) &
+            chunk['instrument_type'].str.upper().isin(COMPACT_TYPES)
+        ]
+        for chunk in reader
+    ], ignore_index=True)
+    expiry = pd.to_datetime(df['expiry'], errors='coerce')
+    df = pd.DataFrame({
+        'instrument_token': df['instrument_token'].astype('int64'),
+        'tradingsymbol': df['tradingsymbol'],
+        'name': df['name'].str.upper().str.strip().astype('category'),
+        'expiry': (expiry.dt.year * 10000 + expiry.dt.month * 100 + expiry.dt.day)
+                  .fillna(0).astype('int32'),
+        'strike': df['strike'].astype('float32'),
+        'lot_size': df['lot_size'].astype('int32'),
+        'instrument_type': df['instrument_type'].str.upper().astype('category'),
+        'exchange': df['exchange'].astype('category'),
+    })
     return df
 
+def _rss_bytes():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, KiB elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _mb(n):
+    return round(n / 2**20, 2) if n is not None else None
+
+def memory_report(df):
+    """Returns the instrument table footprint and this worker's current and peak RSS."""
+    return {
+        'pid': os.getpid(),
+        'rows': len(df),
+        'compact': _is_compact(df),
+        'frame_mb': round(float(df.memory_usage(deep=True).sum()) / 2**20, 2),
+        'rss_mb': _mb(_rss_bytes()),
+        'peak_rss_mb': _mb(_peak_rss_bytes()),
+    }
+
+def _is_compact(df):
+    # compact frames store expiry as int YYYYMMDD, full ones as datetime
+    return is_integer_dtype(df['expiry'])
+
+def _expiry_ymd(df):
+    if _is_compact(df):
+        return df['expiry']
+    exp = df['expiry']
+    return exp.dt.year * 10000 + exp.dt.month * 100 + exp.dt.day
+
 def resolve(df, underlying, day, month, year, strike, opt):
     print(f"[DEBUG] Resolving: {underlying} {day}-{month}-{year} {strike} {opt}")
 
-    df = df[
-        (df['exchange'] == 'NFO') &
-        (df['name'].str.upper() == underlying.upper().strip()) &
-        (df['instrument_type'].str.upper().str.endswith(opt.upper().strip()))
-    ]
+    if _is_compact(df):
+        df = df[
+            (df['name'] == underlying.upper().strip()) &
+            (df['instrument_type'] == opt.upper().strip())
+        ]
+    else:
+        df = df[
+            (df['exchange'] == 'NFO') &
+            (df['name'].str.upper() == underlying.upper().strip()) &
+            (df['instrument_type'].str.upper().str.endswith(opt.upper().strip()))
+        ]
 
     if df.empty:
         print("[DEBUG] No instruments matched underlying+opt filter.")
         return None
 
     # filter by expiry
-    df = df[
-        (df['expiry'].dt.year == year) &
-        (df['expiry'].dt.month == MONTHS[month.upper()]) &
-        (df['expiry'].dt.day == day)
-    ]
+    month_key = year * 100 + MONTHS[month.upper()]
+    df = df[_expiry_ymd(df) == month_key * 100 + day]
     if df.empty:
         print("[DEBUG] No instruments matched expiry, falling back to nearest expiry in month.")
-        df = df[
-            (df['expiry'].dt.year == year) &
-            (df['expiry'].dt.month == MONTHS[month.upper()])
-        ]
-
-    # Find the strike closest to requested
-    df['strike_diff'] = abs(df['strike'] - float(strike))
-    df = df.sort_values('strike_diff')
+        df = df[_expiry_ymd(df) // 100 == month_key]
 
     if df.empty:
         print("[DEBUG] No matching instrument after strike fallback.")
         return None
 
-    target = df.iloc[0]
+    # Find the strike closest to requested
+    target = df.loc[(df['strike'] - float(strike)).abs().idxmin()]
     print(f"[DEBUG] Resolved instrument: {target.tradingsymbol}, lot_size: {target.lot_size}")
     return {
         'instrument_token': int(target.instrument_token),
-        'tradingsymbol': target.tradingsymbol,
-        'exchange': target.exchange,
+        'tradingsymbol': str(target.tradingsymbol),
+        'exchange': str(target.exchange),
         'lot_size': int(target.lot_size)
     }
@@ -1,20 +1,91 @@
 import re
 from datetime import datetime
 MONTHS={'JAN':1,'FEB':2,'MAR':3,'APR':4,'MAY':5,'JUN':6,'JUL':7,'AUG':8,'SEP':9,'OCT':10,'NOV':11,'DEC':12}
-def parse_trade(text):
-    sym = re.search(r'Enter:\s*([A-Z]+)\s+(\d{1,2})\s+([A-Z]{3})\s+(\d{1,6})\s+(CALL|PUT)', text, re.I)
-    rng=re.search(r'Entry Price Range:\s*([0-9]+(?:\.[0-9]+)?)\s*-\s*([0-9]+(?:\.[0-9]+)?)',text,re.I)
-    sl=re.search(r'Stop\s*Loss:\s*([0-9]+(?:\.[0-9]+)?)',text,re.I)
-    tgs=re.findall(r'Target\s*\d+:\s*([0-9]+(?:\.[0-9]+)?)',text,re.I)
+
+# Provider grammars keyed by their trigger keyword (lowercase). All keywords
+# are compiled into one case-insensitive alternation, so a message is
+# classified in a single scan and keywords match anywhere, as substrings. The
+# grammar whose keyword shows up first runs its extractors, and only if it
+# returns nothing do the grammars of later keywords in the message get a turn.
+# Grammars whose keyword never appears don't run, so adding providers doesn't
+# add regex passes for every message.
+FORMATS={}
+_MATCHER=None
+
+def _trie_pattern(words):
+    # Factor shared prefixes (prov(?:a|b|...)) so the regex engine doesn't retry
+    # every keyword at every position; longer branches come first so a keyword
+    # that extends another one wins at the same position.
+    trie={}
+    for w in words:
+        node=trie
+        for ch in w:
+            node=node.setdefault(ch,{})
+        node['']=True
+    def emit(node):
+        alts=[re.escape(ch)+emit(sub) for ch,sub in sorted(node.items(),key=lambda kv:-_depth(kv[1])) if ch]
+        if '' in node:
+            return '(?:'+'|'.join(alts)+')?' if alts else ''
+        return alts[0] if len(alts)==1 else '(?:'+'|'.join(alts)+')'
+    return emit(trie)
+
+def _depth(node):
+    return 0 if node is True else 1+max((_depth(n) for n in node.values()),default=0)
+
+def _rebuild():
+    global _MATCHER
+    _MATCHER=re.compile(_trie_pattern(FORMATS),re.I) if FORMATS else None
+
+def register_format(*keywords):
+    """Register `fn(text)` as the extractor for messages containing any of `keywords`."""
+    for kw in keywords:
+        if not kw:
+            raise ValueError("format keyword must not be empty")
+        if kw.lower() in FORMATS:
+            raise ValueError(f"format keyword already registered: {kw}")
+    def deco(fn):
+        for kw in keywords:
+            FORMATS[kw.lower()]=fn
+        _rebuild()
+        return fn
+    return deco
+
+def unregister_format(keyword):
+    FORMATS.pop(keyword.lower(),None)
+    _rebuild()
+
+def _year(mon):
+    now=datetime.utcnow()
+    return now.year if now.month<=MONTHS[mon] else now.year+1
+
+_ENTER_SYM=re.compile(r'Enter:\s*([A-Z]+)\s+(\d{1,2})\s+([A-Z]{3})\s+(\d{1,6})\s+(CALL|PUT)',re.I)
+_ENTER_RNG=re.compile(r'Entry Price Range:\s*([0-9]+(?:\.[0-9]+)?)\s*-\s*([0-9]+(?:\.[0-9]+)?)',re.I)
+_ENTER_SL=re.compile(r'Stop\s*Loss:\s*([0-9]+(?:\.[0-9]+)?)',re.I)
+_ENTER_TGT=re.compile(r'Target\s*\d+:\s*([0-9]+(?:\.[0-9]+)?)',re.I)
+
+@register_format('enter:')
+def _parse_enter(text):
+    sym=_ENTER_SYM.search(text)
+    rng=_ENTER_RNG.search(text)
+    sl=_ENTER_SL.search(text)
+    tgs=_ENTER_TGT.findall(text)
     if not (sym and rng and sl):
         return None
-    underlying=sym.group(1).upper()
-    day=int(sym.group(2))
     mon=sym.group(3).upper()
-    strike=float(sym.group(4))
-    opt='PE' if sym.group(5).upper().startswith('P') else 'CE'
-    year=datetime.utcnow().year if datetime.utcnow().month<=MONTHS[mon] else datetime.utcnow().year+1
-    entry_low=float(rng.group(1)); entry_high=float(rng.group(2))
-    stoploss=float(sl.group(1))
-    targets=[float(x) for x in tgs] if tgs else []
-    return {'underlying':underlying,'day':day,'month':mon,'year':year,'strike':strike,'opt':opt,'entry_low':entry_low,'entry_high':entry_high,'stoploss':stoploss,'targets':targets}
+    if mon not in MONTHS:
+        return None
+    return {'underlying':sym.group(1).upper(),'day':int(sym.group(2)),'month':mon,'year':_year(mon),'strike':float(sym.group(4)),'opt':'PE' if sym.group(5).upper().startswith('P') else 'CE','entry_low':float(rng.group(1)),'entry_high':float(rng.group(2)),'stoploss':float(sl.group(1)),'targets':[float(x) for x in tgs]}
+
+def parse_trade(text):
+    if _MATCHER is None:
+        return None
+    tried=set()
+    for w in _MATCHER.finditer(text):
+        fn=FORMATS.get(w.group().lower())
+        if fn is None or fn in tried:
+            continue
+        tried.add(fn)
+        res=fn(text)
+        if res:
+            return res
+    return None
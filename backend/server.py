@@ -1,10 +1,11 @@
 import os, uuid, json
-from fastapi import FastAPI, HTTPException,Header,Request
+from fastapi import FastAPI, HTTPException,Header,Request,Response
 from pydantic import BaseModel
 from kiteconnect import KiteConnect
-from instruments import load_instruments, resolve
+from instruments import load_instruments, resolve, memory_report
 from broker import place_limit_option, place_stoploss_order, place_target_order
 from notify import push_fcm
+from feed import TradeFeed, etag_matches
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,6 +13,8 @@ load_dotenv()
 app = FastAPI()
 INSTR = None
 TRADES = {}
+FEED = TradeFeed()
+FEED_MAX_LIMIT = 500
 # kite = KiteConnect(api_key=Z_API_KEY)
 Z_API_KEY = os.getenv("Z_API_KEY")
 Z_API_SECRET = os.getenv("Z_API_SECRET")
@@ -30,8 +33,10 @@ class Raw(BaseModel):
 @app.on_event("startup")
 def boot():
     global INSTR
-    INSTR = load_instruments(os.environ.get("INSTRUMENTS_PATH", "instruments.csv"))
-    print("[DEBUG] Instruments loaded successfully")
+    # INSTRUMENTS_FULL=1 keeps every exchange/column in memory for debugging
+    full = os.environ.get("INSTRUMENTS_FULL", "").lower() in ("1", "true", "yes")
+    INSTR = load_instruments(os.environ.get("INSTRUMENTS_PATH", "instruments.csv"), full=full)
+    print(f"[DEBUG] Instruments loaded successfully: {memory_report(INSTR)}")
 
 @app.post("/ingest")
 def ingest(body: Raw):
@@ -108,6 +113,7 @@ def ingest(body: Raw):
     }
 
     TRADES[tid] = payload
+    FEED.append(payload)
     print(f"[DEBUG] Final trade payload stored: {payload}")
     print(f"[DEBUG] Stored lot_size for trade {tid}: {TRADES[tid]['lot_size']}")
 
@@ -122,6 +128,24 @@ def ingest(body: Raw):
 
     return {"trade_id": tid}
 
+@app.get("/trades")
+def trades(since: str = "", limit: int = 100, if_none_match: str | None = Header(None)):
+    """
+    Trades stored after cursor `since`, oldest first, at most `limit` per page.
+
+    Cursors are opaque "<epoch>.<seq>" strings: pass back `next` from the last
+    page or `cursor` from the last trade seen (e.g. from a push). An empty,
+    bare-seq or other-epoch cursor (the server restarted) replays from the
+    start. Keep paging while `more` is true. Send the ETag back as
+    If-None-Match to get a 304 when nothing new has arrived.
+    """
+    limit = max(1, min(limit, FEED_MAX_LIMIT))
+    etag = FEED.etag(since, limit)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    etag, body = FEED.page(since, limit)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 @app.post("/order")
 def order(c: Confirm, access_token: str = Header(...)):
     print(f"[DEBUG] Place order request received: {c.dict()}")